@@ -1,28 +1,189 @@
+import sys
 import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import statsmodels.stats.api as sms
 import statsmodels.formula.api as smf
 import scipy.stats as stats
+from scipy.special import ndtr
+from joblib import Parallel, delayed
 from MLutilities.utils import cramerv_relationship_strength
-from sklearn.preprocessing import LabelEncoder
 from IPython.display import display
-from typing import Union, Dict, Optional
+from typing import List, NamedTuple, Union, Dict, Optional
 
 """
 This module provides some exploratory data analysis tools.
 """
 
 
+class TestResult(NamedTuple):
+    """Statistic and p-value returned by the tests in this module."""
+
+    statistic: float
+    p_value: float
+
+
+class CramersVResult(NamedTuple):
+    """Cramer's V coefficient with the underlying chi-square and p-value."""
+
+    statistic: float
+    chi2: float
+    p_value: float
+
+
+# fitted Yeo-Johnson lambdas keyed by array contents, so back-to-back tests
+# on the same column (e.g. inside test_assumptions) skip the Brent optimization
+# while an edited column misses instead of reusing a stale fit
+_YJ_LMBDA_CACHE: Dict[tuple, float] = {}
+_YJ_CACHE_MAXSIZE = 128
+
+# factorized categorical columns keyed by column name and contents, so a
+# reassigned column (df["cat"] = ...) misses instead of serving stale codes
+_FACTORIZE_CACHE: Dict[tuple, tuple] = {}
+_FACTORIZE_CACHE_MAXSIZE = 128
+
+
+def _factorized(dataset: pd.DataFrame, column: str):
+    """
+    pd.factorize of a dataframe column, cached so tests that share a
+    categorical column do not re-scan it. Returns (codes, uniques), with
+    the uniques in order of appearance and nulls coded as -1.
+    """
+    values = dataset[column].to_numpy()
+    key = (column, _array_key(values))
+    hit = _FACTORIZE_CACHE.get(key)
+    if hit is not None:
+        return hit
+    codes, uniques = pd.factorize(values)
+    if len(_FACTORIZE_CACHE) >= _FACTORIZE_CACHE_MAXSIZE:
+        _FACTORIZE_CACHE.clear()
+    _FACTORIZE_CACHE[key] = (codes, uniques)
+    return codes, uniques
+
+
+def _ensure_df(dataset) -> pd.DataFrame:
+    """
+    Wrap a dict dataset in a DataFrame. Inputs that already are DataFrames
+    pass through untouched, so nested calls do not re-run column inference.
+    """
+    if isinstance(dataset, pd.DataFrame):
+        return dataset
+    return pd.DataFrame(dataset)
+
+
+def _contingency_table(x_codes, x_unique, y_codes, y_unique):
+    """
+    Contingency table from two factorized nominal columns, built in a
+    single pass. Returns the count matrix together with the unique values
+    of x (rows) and y (columns), both sorted like pd.crosstab, but without
+    building an intermediate DataFrame.
+    """
+    counts = np.bincount(
+        x_codes * len(y_unique) + y_codes, minlength=len(x_unique) * len(y_unique)
+    ).reshape(len(x_unique), len(y_unique))
+    x_order = np.argsort(x_unique)
+    y_order = np.argsort(y_unique)
+    return counts[np.ix_(x_order, y_order)], x_unique[x_order], y_unique[y_order]
+
+
+# sorted copies of columns keyed by array contents, so repeated KS tests
+# on the same column skip the O(n log n) sort; kept small because every
+# entry is a full-size array
+_SORTED_CACHE: Dict[tuple, np.ndarray] = {}
+_SORTED_CACHE_MAXSIZE = 32
+
+
+def _array_key(x: np.ndarray) -> tuple:
+    """
+    Cache key for an array: shape, dtype and a hash of the contents, so
+    both recycled allocations and in-place edits invalidate the entry.
+    The hashing pass is linear but far cheaper than the fits, sorts and
+    factorizations these caches avoid.
+    """
+    return (x.shape, x.dtype.str, hash(x.tobytes()))
+
+
+def _sorted_values(x: np.ndarray) -> np.ndarray:
+    """np.sort along the last axis, cached by array contents."""
+    key = _array_key(x)
+    xs = _SORTED_CACHE.get(key)
+    if xs is None:
+        if len(_SORTED_CACHE) >= _SORTED_CACHE_MAXSIZE:
+            _SORTED_CACHE.clear()
+        xs = np.sort(x, axis=-1)
+        _SORTED_CACHE[key] = xs
+    return xs
+
+
+def _ks_norm_sorted(xs: np.ndarray) -> TestResult:
+    """
+    One-sample Kolmogorov-Smirnov test of already-sorted data against the
+    standard normal, along the last axis. Matches
+    stats.kstest(x, 'norm', method='asymp') but computes the CDF with one
+    vectorized ndtr call instead of going through the generic
+    distribution machinery.
+    """
+    n = xs.shape[-1]
+    cdf = ndtr(xs)
+    i = np.arange(1.0, n + 1)
+    d_plus = (i / n - cdf).max(axis=-1)
+    d_minus = (cdf - (i - 1) / n).max(axis=-1)
+    statistic = np.maximum(d_plus, d_minus)
+    p_value = np.clip(stats.kstwobign.sf(statistic * np.sqrt(n)), 0, 1)
+    return TestResult(statistic, p_value)
+
+
+def _yj_transform(x: np.ndarray, lmbda: float) -> np.ndarray:
+    """
+    Apply the Yeo-Johnson transform for a known lambda. Equivalent to
+    stats.yeojohnson(x, lmbda=lmbda), but written with log1p/expm1 for
+    numerical stability and a single preallocated output array.
+    """
+    # lambda 1 is the identity transform, so skip the array passes entirely
+    if abs(lmbda - 1.0) < 1e-12:
+        return x if x.dtype.kind == "f" else x.astype(np.float64)
+    out = np.empty_like(x, dtype=x.dtype if x.dtype.kind == "f" else np.float64)
+    pos = x >= 0
+    neg = ~pos
+    if abs(lmbda) < np.spacing(1.0):
+        out[pos] = np.log1p(x[pos])
+    else:
+        out[pos] = np.expm1(lmbda * np.log1p(x[pos])) / lmbda
+    if abs(lmbda - 2) < np.spacing(1.0):
+        out[neg] = -np.log1p(-x[neg])
+    else:
+        out[neg] = -np.expm1((2 - lmbda) * np.log1p(-x[neg])) / (2 - lmbda)
+    return out
+
+
+def _yeojohnson(x: np.ndarray) -> np.ndarray:
+    """
+    Yeo-Johnson transform of x that caches the fitted lambda, so repeated
+    calls on the same array only pay for the closed-form transform.
+    """
+    key = _array_key(x)
+    lmbda = _YJ_LMBDA_CACHE.get(key)
+    if lmbda is None:
+        if len(_YJ_LMBDA_CACHE) >= _YJ_CACHE_MAXSIZE:
+            _YJ_LMBDA_CACHE.clear()
+        lmbda = stats.yeojohnson_normmax(x)
+        _YJ_LMBDA_CACHE[key] = lmbda
+    return _yj_transform(x, lmbda)
+
+
 def kolmogorov_test(
     dataset,
-    variable: str,
+    variable: Union[str, List[str]],
     transformation: str = None,
     plot_histogram: bool = False,
     bins: int = 30,
     color: str = None,
+    verbose: bool = True,
+    dtype: type = np.float64,
 ):
     """
     This function computes Kolmogorov test to check if the variable
@@ -36,52 +197,106 @@ def kolmogorov_test(
     Arguments:
     ----------
         dataset: pandas dataframe or dict with de format {'col1':np.array, 'col2':np.array}
-        variable: variable to performe the Kolmogorov test
+        variable: variable or list of variables to performe the Kolmogorov test.
+            When a list is given the test is computed for all the variables at once
+            using a single vectorized call. Rows with a null in any of the listed
+            variables are dropped from every test, so the batched results can
+            differ from separate single-variable calls when the columns have
+            different missing-value patterns
         transformation: kind of transformation to apply. Options:
              - yeo_johnson: appy yeo johnson transformation to the input variable
              - log: apply logarithm transformation to the input variable
         plot_histogram:If True plot a histogram of the variable
         bins: Number of bins to use when plotting the histogram
         color: Name of column in dataset. Values from this column are used to assign color to marks.
+        verbose: If False skip the printed report and only return the results
+        dtype: dtype the variables are cast to before transforming. np.float32
+            halves the memory traffic when that precision is enough for EDA
+
+    Returns the statistic and p-value (arrays when a list of variables is given)
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
 
-    dataset = dataset.dropna(subset=[variable]).copy()
+    variables = [variable] if isinstance(variable, str) else list(variable)
+
+    dataset = dataset.dropna(subset=variables).copy()
+
+    x = dataset[variables].to_numpy(dtype=dtype, copy=False).T
 
     if transformation == "yeo_johnson":
-        x = stats.yeojohnson(dataset[variable].to_numpy())[0]
+        x = np.stack([_yeojohnson(xi) for xi in x])
     elif transformation == "log":
-        x = np.log1p(dataset[variable].to_numpy())
-    else:
-        x = dataset[variable].to_numpy()
-
-    x_scale = (x - x.mean()) / x.std()
+        x = np.log1p(x)
+
+    # standardization is monotone, so sorting first lets the sorted copy
+    # be cached on the untransformed column and reused across calls
+    xs = _sorted_values(x)
+    x_scale = (xs - xs.mean(axis=-1, keepdims=True)) / xs.std(axis=-1, keepdims=True)
+
+    statistics, p_values = _ks_norm_sorted(x_scale)
+
+    if verbose:
+        for name, statistic, p_value in zip(variables, statistics, p_values):
+            if p_value < 0.05:
+                conclusion = f"Since {p_value:.3f} < 0.05 you can reject the null hypothesis, so the variable {name} \ndo not follow a normal distribution"  # noqa: E501
+            else:
+                conclusion = f"Since {p_value:.3f} > 0.05 you cannot reject the null hypothesis, so the variable {name} \nfollows a normal distribution"  # noqa: E501
+            sys.stdout.write(
+                f"------------------------- Kolmogorov test fot the variable {name} --------------------\n"
+                f"statistic={statistic:.3f}, p_value={p_value:.3f}\n\n"
+                f"{conclusion}\n"
+                "-------------------------------------------------------------------------------------------\n\n"
+            )
 
-    ktest = stats.kstest(x_scale, "norm")
-    print(
-        f"------------------------- Kolmogorov test fot the variable {variable} --------------------"
-    )
-    print(f"statistic={ktest[0]:.3f}, p_value={ktest[1]:.3f}\n")
-    if ktest[1] < 0.05:
-        print(
-            f"Since {ktest[1]:.3f} < 0.05 you can reject the null hypothesis, so the variable {variable} \ndo not follow a normal distribution"  # noqa: E501
-        )
-    else:
-        print(
-            f"Since {ktest[1]:.3f} > 0.05 you cannot reject the null hypothesis, so the variable {variable} \nfollows a normal distribution"
-        )
-    print(
-        "-------------------------------------------------------------------------------------------\n"
-    )
     if plot_histogram:
-        fig = px.histogram(
-            dataset, x=x, nbins=bins, marginal="box", color=color, barmode="overlay"
-        )
-        fig.update_traces(marker_line_width=1, marker_line_color="white", opacity=0.8)
-        fig.update_layout(xaxis_title=variable, width=1500, height=500)
-        fig.show()
+        for name, xi in zip(variables, x):
+            if color is None:
+                # pre-bin in numpy so the figure ships O(bins) points to the
+                # browser instead of serializing the whole column
+                counts, edges = np.histogram(xi, bins=bins)
+                sample = (
+                    np.random.choice(xi, size=5000, replace=False)
+                    if xi.size > 5000
+                    else xi
+                )
+                fig = make_subplots(
+                    rows=2, cols=1, shared_xaxes=True, row_heights=[0.2, 0.8]
+                )
+                fig.add_trace(go.Box(x=sample, showlegend=False), row=1, col=1)
+                fig.add_trace(
+                    go.Bar(
+                        x=(edges[:-1] + edges[1:]) / 2,
+                        y=counts,
+                        width=np.diff(edges),
+                        marker_line_width=1,
+                        marker_line_color="white",
+                        opacity=0.8,
+                        showlegend=False,
+                    ),
+                    row=2,
+                    col=1,
+                )
+                fig.update_layout(width=1500, height=500, bargap=0)
+                fig.update_xaxes(title_text=name, row=2, col=1)
+            else:
+                fig = px.histogram(
+                    dataset,
+                    x=xi,
+                    nbins=bins,
+                    marginal="box",
+                    color=color,
+                    barmode="overlay",
+                )
+                fig.update_traces(
+                    marker_line_width=1, marker_line_color="white", opacity=0.8
+                )
+                fig.update_layout(xaxis_title=name, width=1500, height=500)
+            fig.show()
+
+    if isinstance(variable, str):
+        return TestResult(float(statistics[0]), float(p_values[0]))
+    return TestResult(statistics, p_values)
 
 
 def shapiro_test(
@@ -91,6 +306,7 @@ def shapiro_test(
     plot_histogram: bool = False,
     bins: int = 30,
     color: str = None,
+    verbose: bool = True,
 ):
     """
     This function computes Shapiro test to check if the variable
@@ -111,38 +327,35 @@ def shapiro_test(
         plot_histogram:If True plot a histogram of the variable
         bins: Number of bins to use when plotting the histogram
         color: Name of column in dataset. Values from this column are used to assign color to marks.
+        verbose: If False skip the printed report and only return the results
+
+    Returns the statistic and p-value
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
 
     dataset = dataset.dropna(subset=[variable]).copy()
 
+    x = np.ascontiguousarray(dataset[variable].to_numpy(copy=False))
     if transformation == "yeo_johnson":
-        x = stats.yeojohnson(dataset[variable].to_numpy())[0]
+        x = _yeojohnson(x)
     elif transformation == "log":
-        x = np.log1p(dataset[variable].to_numpy())
-    else:
-        x = dataset[variable].to_numpy()
+        x = np.log1p(x)
 
     x_scale = (x - x.mean()) / x.std()
 
     ktest = stats.shapiro(x_scale)
-    print(
-        f"------------------------- Shapiro test fot the variable {variable} --------------------"
-    )
-    print(f"statistic={ktest[0]:.3f}, p_value={ktest[1]:.3f}\n")
-    if ktest[1] < 0.05:
-        print(
-            f"Since {ktest[1]:.3f} < 0.05 you can reject the null hypothesis, so the variable {variable} \ndo not follow a normal distribution"  # noqa: E501
-        )
-    else:
-        print(
-            f"Since {ktest[1]:.3f} > 0.05 you cannot reject the null hypothesis, so the variable {variable} \nfollows a normal distribution"
+    if verbose:
+        if ktest[1] < 0.05:
+            conclusion = f"Since {ktest[1]:.3f} < 0.05 you can reject the null hypothesis, so the variable {variable} \ndo not follow a normal distribution"  # noqa: E501
+        else:
+            conclusion = f"Since {ktest[1]:.3f} > 0.05 you cannot reject the null hypothesis, so the variable {variable} \nfollows a normal distribution"  # noqa: E501
+        sys.stdout.write(
+            f"------------------------- Shapiro test fot the variable {variable} --------------------\n"
+            f"statistic={ktest[0]:.3f}, p_value={ktest[1]:.3f}\n\n"
+            f"{conclusion}\n"
+            "-------------------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "-------------------------------------------------------------------------------------------\n"
-    )
     if plot_histogram:
         fig = px.histogram(
             dataset, x=x, nbins=bins, marginal="box", color=color, barmode="overlay"
@@ -151,6 +364,8 @@ def shapiro_test(
         fig.update_layout(xaxis_title=variable, width=1500, height=500)
         fig.show()
 
+    return TestResult(float(ktest[0]), float(ktest[1]))
+
 
 def biserial_correlation(
     dataset,
@@ -159,6 +374,8 @@ def biserial_correlation(
     transformation: str = None,
     box_plot: bool = False,
     test_assumptions: bool = False,
+    verbose: bool = True,
+    dtype: type = np.float64,
 ):
     """
     A point-biserial correlation is used to measure the correlation between
@@ -181,77 +398,89 @@ def biserial_correlation(
         If Ture display a boxplot
     test_assumptions: bool
         If True test the assuptioms for the continuos variable
+    verbose: bool
+        If False skip the printed report and only return the results
+    dtype: type
+        dtype the numerical variable is cast to before transforming. np.float32
+        halves the memory traffic when that precision is enough for EDA
+
+    Returns the statistic and p-value
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
 
-    if test_assumptions:
-        y_unique = dataset[categorical_variable].unique()
-        x1 = dataset.loc[
-            dataset[categorical_variable] == y_unique[0], [numerical_variable]
-        ]
-        x2 = dataset.loc[
-            dataset[categorical_variable] == y_unique[1], [numerical_variable]
-        ]
+    codes, y_unique = _factorized(dataset, categorical_variable)
 
-        print(
-            f"------------------------Kolmogorov Test for {categorical_variable}:{y_unique[0]}---------------------------"
-        )
-        kolmogorov_test(
-            x1,
-            numerical_variable,
-            transformation=transformation,
-            plot_histogram=False,
-        )
-        print(
-            f"------------------------Kolmogorov Test for {categorical_variable}:{y_unique[1]}---------------------------"
-        )
+    if test_assumptions:
+        num = dataset[numerical_variable]
+        if verbose:
+            print(
+                f"------------------------Kolmogorov Test for {categorical_variable}:{y_unique[0]}---------------------------"
+            )
         kolmogorov_test(
-            x2,
+            num[codes == 0].to_frame(),
             numerical_variable,
             transformation=transformation,
             plot_histogram=False,
+            verbose=verbose,
         )
+        # a single-valued categorical has no second group to test
+        if len(y_unique) > 1:
+            if verbose:
+                print(
+                    f"------------------------Kolmogorov Test for {categorical_variable}:{y_unique[1]}---------------------------"
+                )
+            kolmogorov_test(
+                num[codes == 1].to_frame(),
+                numerical_variable,
+                transformation=transformation,
+                plot_histogram=False,
+                verbose=verbose,
+            )
 
-        print(
-            "--------------------------------Levene Test-----------------------------------"
-        )
-        levene_test(dataset, categorical_variable, numerical_variable)
+            if verbose:
+                print(
+                    "--------------------------------Levene Test-----------------------------------"
+                )
+            levene_test(
+                dataset, categorical_variable, numerical_variable, verbose=verbose
+            )
 
-    # Point Biserial correlation Test
-    y = LabelEncoder().fit_transform(dataset[categorical_variable])
+    # Point Biserial correlation Test: a 0/1 mask is all pointbiserialr needs,
+    # so a direct comparison on the codes beats encoding the column
+    y = np.equal(codes, len(y_unique) - 1).astype(np.int8, copy=False)
 
+    # one contiguous array for every branch; pointbiserialr would otherwise
+    # force its own conversion (and a copy on extension dtypes)
+    x = np.ascontiguousarray(
+        dataset[numerical_variable].to_numpy(dtype=dtype, copy=False)
+    )
     if transformation == "yeo_johnson":
-        x = stats.yeojohnson(dataset[numerical_variable].to_numpy())[0]
+        x = _yeojohnson(x)
     elif transformation == "log":
-        x = np.log1p(dataset[numerical_variable].to_numpy())
-    else:
-        x = dataset[numerical_variable].to_numpy()
+        x = np.log1p(x)
 
     biserial = stats.pointbiserialr(y, x)
-    print(
-        "---------------------------Point Biserial Test--------------------------------"
-    )
-    print(f"statistic={biserial[0]:.3f}, p_value={biserial[1]:.3f}\n")
-    if biserial[1] < 0.05:
-        print(
-            f"Since {biserial[1]:.3f} < 0.05 you can reject the null hypothesis, \nso variables are correlated"
-        )
-    else:
-        print(
-            f"Since {biserial[1]:.3f} > 0.05 you cannot reject the null hypothesis, \nso variables are not correlated"
+    if verbose:
+        if biserial[1] < 0.05:
+            conclusion = f"Since {biserial[1]:.3f} < 0.05 you can reject the null hypothesis, \nso variables are correlated"
+        else:
+            conclusion = f"Since {biserial[1]:.3f} > 0.05 you cannot reject the null hypothesis, \nso variables are not correlated"
+        sys.stdout.write(
+            "---------------------------Point Biserial Test--------------------------------\n"
+            f"statistic={biserial[0]:.3f}, p_value={biserial[1]:.3f}\n\n"
+            f"{conclusion}\n"
+            "------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "------------------------------------------------------------------------------\n"
-    )
 
     if box_plot:
         fig = px.box(dataset, x=categorical_variable, y=numerical_variable)
         fig.show()
 
+    return TestResult(float(biserial[0]), float(biserial[1]))
+
 
-def levene_test(dataset, categorical_variable, numerical_variable):
+def levene_test(dataset, categorical_variable, numerical_variable, verbose=True):
     """
 
     Levenes test is used to check that variances are equal for all
@@ -269,38 +498,36 @@ def levene_test(dataset, categorical_variable, numerical_variable):
             Name of the categorical variable
         input_varaible: string
             Name of the numerical variable
+        verbose: bool
+            If False skip the printed report and only return the results
 
+    Returns the statistic and p-value
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
-
-    y_unique = dataset[categorical_variable].unique()
+    dataset = _ensure_df(dataset)
 
-    x1 = dataset.loc[
-        dataset[categorical_variable] == y_unique[0], numerical_variable
-    ].to_numpy()
-    x2 = dataset.loc[
-        dataset[categorical_variable] == y_unique[1], numerical_variable
-    ].to_numpy()
+    # masks over the cached integer codes are far cheaper than comparing
+    # the original (often object-dtype) column values
+    codes, _ = _factorized(dataset, categorical_variable)
+    num = dataset[numerical_variable].to_numpy()
+    x1 = num[codes == 0]
+    x2 = num[codes == 1]
 
     levene = stats.levene(x1, x2)
 
-    print(
-        "------------------------------------------------------------------------------"
-    )
-    print(f"statistic={levene[0]:.3f}, p_value={levene[1]:.3f}\n")
-    if levene[1] < 0.05:
-        print(
-            f"Since {levene[1]:.3f} < 0.05 you can reject the null hypothesis, \nso variances_1 != variances_2"
-        )
-    else:
-        print(
-            f"Since {levene[1]:.3f} > 0.05 you cannot reject the null hypothesis, \nso variances_1 = variances_2"
+    if verbose:
+        if levene[1] < 0.05:
+            conclusion = f"Since {levene[1]:.3f} < 0.05 you can reject the null hypothesis, \nso variances_1 != variances_2"
+        else:
+            conclusion = f"Since {levene[1]:.3f} > 0.05 you cannot reject the null hypothesis, \nso variances_1 = variances_2"
+        sys.stdout.write(
+            "------------------------------------------------------------------------------\n"
+            f"statistic={levene[0]:.3f}, p_value={levene[1]:.3f}\n\n"
+            f"{conclusion}\n"
+            "------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "------------------------------------------------------------------------------\n"
-    )
+
+    return TestResult(float(levene[0]), float(levene[1]))
 
 
 # Kruskall-Wallas Test
@@ -310,6 +537,7 @@ def kruskal_test(
     input_variable: str,
     plot_boxplot: bool = False,
     show_shapes: bool = False,
+    verbose: bool = True,
 ):
     """
     The Kruskal-Wallis H test is a rank-based nonparametric test
@@ -332,51 +560,52 @@ def kruskal_test(
             Name of the categorical variable
         input_varaible: string
             Name of the numerical variable
+        verbose: bool
+            If False skip the printed report and only return the results
 
+    Returns the statistic and p-value
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
 
     dataset = dataset.dropna(subset=[target_variable, input_variable]).copy()
 
     y_unique = dataset[target_variable].unique()
 
-    x = [
-        dataset.loc[dataset[target_variable] == unique, input_variable]
-        for unique in y_unique
-    ]
+    # one groupby pass instead of one boolean-mask scan per category
+    groups = dict(
+        iter(dataset.groupby(target_variable, sort=False)[input_variable])
+    )
+    x = [groups[unique].to_numpy() for unique in y_unique]
 
-    if show_shapes:
-        print(
+    if show_shapes and verbose:
+        lines = [
             "--------------------------------Skewness and Kurtosis-------------------------"
-        )
-
+        ]
         for xi, yi in zip(x, y_unique):
-            print(
-                f"Skweness and kurtosis for {target_variable}:{yi}. Skweness={xi.skew():.3f}, Kurtosis={xi.kurtosis():.3f}"
+            # stats.describe gets both moments in one pass; bias=False
+            # matches the corrected estimators pandas uses
+            shape = stats.describe(xi, bias=False)
+            lines.append(
+                f"Skweness and kurtosis for {target_variable}:{yi}. Skweness={shape.skewness:.3f}, Kurtosis={shape.kurtosis:.3f}"
             )
-
-        print(
-            "------------------------------------------------------------------------------\n"
+        lines.append(
+            "------------------------------------------------------------------------------\n\n"
         )
+        sys.stdout.write("\n".join(lines))
 
     kruskal = stats.kruskal(*x)
-    print(
-        "------------------------------------------------------------------------------"
-    )
-    print(f"statistic={kruskal[0]:.3f}, p_value={kruskal[1]:.3f}\n")
-    if kruskal[1] < 0.05:
-        print(
-            f"Since {kruskal[1]:.3f} < 0.05 you can reject the null hypothesis, \nso we have that medians_1 != medians_2 != ...."
-        )
-    else:
-        print(
-            f"Since {kruskal[1]:.3f} > 0.05 you cannot reject the null hypothesis \nso we have that medians_1 = medians_2 = ...."
+    if verbose:
+        if kruskal[1] < 0.05:
+            conclusion = f"Since {kruskal[1]:.3f} < 0.05 you can reject the null hypothesis, \nso we have that medians_1 != medians_2 != ...."  # noqa: E501
+        else:
+            conclusion = f"Since {kruskal[1]:.3f} > 0.05 you cannot reject the null hypothesis \nso we have that medians_1 = medians_2 = ...."  # noqa: E501
+        sys.stdout.write(
+            "------------------------------------------------------------------------------\n"
+            f"statistic={kruskal[0]:.3f}, p_value={kruskal[1]:.3f}\n\n"
+            f"{conclusion}\n"
+            "------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "------------------------------------------------------------------------------\n"
-    )
 
     if plot_boxplot:
         fig = px.box(
@@ -388,6 +617,8 @@ def kruskal_test(
         )
         fig.show()
 
+    return TestResult(float(kruskal[0]), float(kruskal[1]))
+
 
 # Creamers V Correlation
 def cramersv(
@@ -397,6 +628,7 @@ def cramersv(
     show_crosstab: bool = False,
     plot_histogram: bool = False,
     histnorm: str = "percent",
+    verbose: bool = True,
 ):
     """
     This function computes cramer's V correlation coefficient which is a measure of association between two nominal variables.
@@ -418,58 +650,85 @@ def cramersv(
             It can be either 'percent' or 'count'. If 'percent'
             show the percengate of each category, if 'count' show
             the frequency of each category.
+        verbose: bool
+            If False skip the printed report and only return the results
 
     If p_value < 0.5 you can reject the null hypothesis
-    """
-
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
-
-    dataset = dataset.dropna(subset=[input_feature, target_feature])
 
-    obs = pd.crosstab(dataset[input_feature], dataset[target_feature], margins=False)
-    chi2, p, dof, ex = stats.chi2_contingency(obs, correction=False)
+    Returns the Cramer's V coefficient and p-value
+    """
 
-    if show_crosstab:
-        print("----------------------- Contingency Table -------------------------")
-        display(
-            pd.crosstab(
-                dataset[input_feature], dataset[target_feature], margins=True
-            ).style.background_gradient(cmap="Blues")
+    dataset = _ensure_df(dataset)
+
+    x_codes, x_unique = _factorized(dataset, input_feature)
+    y_codes, y_unique = _factorized(dataset, target_feature)
+
+    # factorize codes nulls as -1, so the null-pair mask falls straight
+    # out of the cached codes
+    valid = (x_codes >= 0) & (y_codes >= 0)
+    if not valid.all():
+        x_codes = x_codes[valid]
+        y_codes = y_codes[valid]
+
+    obs, x_unique, y_unique = _contingency_table(x_codes, x_unique, y_codes, y_unique)
+
+    # a category that only ever pairs with a null in the other column leaves
+    # an all-zero row or column behind; drop it, as pd.crosstab of the
+    # filtered frame would, so the expected frequencies stay positive
+    if not valid.all():
+        row_keep = obs.any(axis=1)
+        col_keep = obs.any(axis=0)
+        if not (row_keep.all() and col_keep.all()):
+            obs = obs[np.ix_(row_keep, col_keep)]
+            x_unique = x_unique[row_keep]
+            y_unique = y_unique[col_keep]
+
+    # chi-square straight from the marginal sums; chi2_contingency would
+    # also materialize the expected-frequency matrix, which is never used
+    row_sums = obs.sum(axis=1)
+    col_sums = obs.sum(axis=0)
+    dimension = row_sums.sum()
+    expected = np.outer(row_sums, col_sums) / dimension
+    chi2 = ((obs - expected) ** 2 / expected).sum()
+    dof = (obs.shape[0] - 1) * (obs.shape[1] - 1)
+    p = stats.distributions.chi2.sf(chi2, dof)
+
+    if show_crosstab and verbose:
+        crosstab = pd.DataFrame(
+            obs,
+            index=pd.Index(x_unique, name=input_feature),
+            columns=pd.Index(y_unique, name=target_feature),
         )
+        crosstab["All"] = crosstab.sum(axis=1)
+        crosstab.loc["All"] = crosstab.sum(axis=0)
+        print("----------------------- Contingency Table -------------------------")
+        display(crosstab.style.background_gradient(cmap="Blues"))
         print("------------------------------------------------------------------\n")
 
-    dimension = obs.to_numpy().sum()
     cramer = np.sqrt((chi2 / dimension) / (np.min(obs.shape) - 1))
 
     # interpretation
-    n_rows = dataset[target_feature].nunique()
-    n_cols = dataset[input_feature].nunique()
-    degrees_of_freedom = min(n_rows - 1, n_cols - 1)
+    degrees_of_freedom = min(len(y_unique) - 1, len(x_unique) - 1)
 
     strength = cramerv_relationship_strength(
         5 if degrees_of_freedom > 4 else degrees_of_freedom, cramer
     )
 
-    print(
-        "---------------------------------------------- Cramer's V --------------------------------------------"
-    )
-    print(f"CramersV: {cramer:.3f}, chi2:{chi2:.3f}, p_value:{p:.5f}\n")
-    if p < 0.05:
-        print(
-            f"Since {p:.5f} < 0.05 you can reject the null hypothesis, \nThere is a {strength} relationship between the variables."
-        )
-    else:
-        print(
-            f"Since {p:.5f} > 0.05 you cannot reject the null hypothesis, \nso there is not a relationship between the variables."
+    if verbose:
+        if p < 0.05:
+            conclusion = f"Since {p:.5f} < 0.05 you can reject the null hypothesis, \nThere is a {strength} relationship between the variables."  # noqa: E501
+        else:
+            conclusion = f"Since {p:.5f} > 0.05 you cannot reject the null hypothesis, \nso there is not a relationship between the variables."  # noqa: E501
+        sys.stdout.write(
+            "---------------------------------------------- Cramer's V --------------------------------------------\n"
+            f"CramersV: {cramer:.3f}, chi2:{chi2:.3f}, p_value:{p:.5f}\n\n"
+            f"{conclusion}\n"
+            "------------------------------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "------------------------------------------------------------------------------------------------------\n"
-    )
 
     if plot_histogram:
         fig = px.histogram(
-            dataset,
+            dataset.loc[valid],
             x=input_feature,
             histnorm=histnorm,
             color=target_feature,
@@ -479,8 +738,12 @@ def cramersv(
         )
         fig.show()
 
+    return CramersVResult(float(cramer), float(chi2), float(p))
+
 
-def breusch_pagan_test(dataset, target_variable: str, input_variable: str):
+def breusch_pagan_test(
+    dataset, target_variable: str, input_variable: str, verbose: bool = True
+):
     """
     Breusch-Pagan test is a way to check whether heteroscedasticity exists in regression analysis.
     A Breusch-Pagan test follows the below hypotheses:
@@ -494,11 +757,13 @@ def breusch_pagan_test(dataset, target_variable: str, input_variable: str):
             Name of one numercial variable
         input_variable: string
             Name of one numercial variable
+        verbose: bool
+            If False skip the printed report and only return the results
 
+    Returns the statistic and p-value
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
 
     # fit regression model
     fit_lr = smf.ols(f"{target_variable} ~ {input_variable}", data=dataset).fit()
@@ -506,21 +771,19 @@ def breusch_pagan_test(dataset, target_variable: str, input_variable: str):
     # perform Bresuch-Pagan test
     statistic, p_value, _, _ = sms.het_breuschpagan(fit_lr.resid, fit_lr.model.exog)
 
-    print(
-        "------------------------------------ Breusch-Pagan test ----------------------------------"
-    )
-    print(f"statistic={statistic:.3f}, p_value={p_value:.3f}\n")
-    if p_value < 0.05:
-        print(
-            f"Since {p_value:.3f} < 0.05 you can reject the null hypothesis, so homoscedasticity is not present"
-        )
-    else:
-        print(
-            f"Since {p_value:.3f} > 0.05 you cannot reject the null hypothesis, so homoscedasticity is present"
+    if verbose:
+        if p_value < 0.05:
+            conclusion = f"Since {p_value:.3f} < 0.05 you can reject the null hypothesis, so homoscedasticity is not present"
+        else:
+            conclusion = f"Since {p_value:.3f} > 0.05 you cannot reject the null hypothesis, so homoscedasticity is present"
+        sys.stdout.write(
+            "------------------------------------ Breusch-Pagan test ----------------------------------\n"
+            f"statistic={statistic:.3f}, p_value={p_value:.3f}\n\n"
+            f"{conclusion}\n"
+            "-------------------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "-------------------------------------------------------------------------------------------\n"
-    )
+
+    return TestResult(float(statistic), float(p_value))
 
 
 def correlation_coef(
@@ -532,6 +795,7 @@ def correlation_coef(
     breusch_pagan: bool = False,
     scatter_plot: bool = False,
     apply_log_transform: bool = False,
+    verbose: bool = True,
 ):
     """
     This function computes the correlation between two numerical variables.
@@ -560,6 +824,10 @@ def correlation_coef(
             If True a scatter plot is display
         apply_log_transform: bool
             If Ture apply a logarithm transformation to input and target variables
+        verbose: bool
+            If False skip the printed report and only return the results
+
+    Returns the statistic and p-value
     """
 
     assert kind in [
@@ -568,20 +836,20 @@ def correlation_coef(
         "pearson",
     ], "kind must be one of the options in the list ['spearmn', 'kendall', 'pearson']"
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset).copy()
+    dataset = _ensure_df(dataset)
 
     if (apply_log_transform) and (target_variable != input_variable):
         dataset = np.log1p(dataset[[target_variable, input_variable]].dropna().copy())
-        print(dataset.head())
+        if verbose:
+            print(dataset.head())
 
     if kind == "pearson":
         df = dataset[[target_variable, input_variable]].dropna().copy()
         if kolmogorov:
-            kolmogorov_test(df, target_variable)
-            kolmogorov_test(df, input_variable)
+            kolmogorov_test(df, target_variable, verbose=verbose)
+            kolmogorov_test(df, input_variable, verbose=verbose)
         if breusch_pagan:
-            breusch_pagan_test(df, target_variable, input_variable)
+            breusch_pagan_test(df, target_variable, input_variable, verbose=verbose)
         corr, p_value = stats.pearsonr(
             df.iloc[:, 0],
             df.iloc[:, 1],
@@ -599,21 +867,17 @@ def correlation_coef(
             nan_policy="omit",
         )
 
-    print(
-        f"------------------------------------ {kind} correlation ---------------------------------"
-    )
-    print(f"statistic={corr:.3f}, p_value={p_value:.3f}\n")
-    if p_value < 0.05:
-        print(
-            f"Since {p_value:.3f} < 0.05 you can reject the null hypothesis, so the variables {target_variable} \nand {input_variable} are correlated"  # noqa: E501
-        )
-    else:
-        print(
-            f"Since {p_value:.3f} > 0.05 you cannot reject the null hypothesis, so the variables {target_variable} \nand {input_variable} are not correlated"  # noqa: E501
+    if verbose:
+        if p_value < 0.05:
+            conclusion = f"Since {p_value:.3f} < 0.05 you can reject the null hypothesis, so the variables {target_variable} \nand {input_variable} are correlated"  # noqa: E501
+        else:
+            conclusion = f"Since {p_value:.3f} > 0.05 you cannot reject the null hypothesis, so the variables {target_variable} \nand {input_variable} are not correlated"  # noqa: E501
+        sys.stdout.write(
+            f"------------------------------------ {kind} correlation ---------------------------------\n"
+            f"statistic={corr:.3f}, p_value={p_value:.3f}\n\n"
+            f"{conclusion}\n"
+            "-------------------------------------------------------------------------------------------\n\n"
         )
-    print(
-        "-------------------------------------------------------------------------------------------\n"
-    )
 
     if scatter_plot:
         fig = px.scatter(
@@ -629,6 +893,8 @@ def correlation_coef(
         fig.update_traces(marker_line_width=1, marker_line_color="white", opacity=0.8)
         fig.show()
 
+    return TestResult(float(corr), float(p_value))
+
 
 def contingency_table(
     dataset, target_variable: str, input_variable: str, table_size: int = 30
@@ -646,8 +912,7 @@ def contingency_table(
             size of the displayed table in pixels
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
 
     obs = pd.crosstab(dataset[input_variable], dataset[target_variable], margins=True)
 
@@ -683,16 +948,14 @@ def kde_plot(
         plot_boxplot (bool, optional): Whether to add a boxplot in the margin of the KDE plot. Default is False.
     """
 
-    if type(dataset) == dict:
-        dataset = pd.DataFrame(dataset)
+    dataset = _ensure_df(dataset)
     dataset = dataset.dropna(subset=[variable]).copy()
 
+    x = np.ascontiguousarray(dataset[variable].to_numpy(copy=False))
     if transformation == "yeo_johnson":
-        x = stats.yeojohnson(dataset[variable].to_numpy())[0]
+        x = _yeojohnson(x)
     elif transformation == "log":
-        x = np.log1p(dataset[variable].to_numpy())
-    else:
-        x = dataset[variable].to_numpy()
+        x = np.log1p(x)
     x_scale = (x - x.mean()) / x.std()
 
     if plot_boxplot:
@@ -713,3 +976,58 @@ def kde_plot(
         sns.kdeplot(x=x, hue=dataset[color] if color else None, ax=ax)
         ax.set_ylabel("Density", size=15)
         ax.set_xlabel(variable, size=15)
+
+
+# tests run_eda knows how to dispatch, paired with the parameters the
+# column entries bind to; each one accepts verbose=False and returns
+# (statistic, p_value)
+_EDA_TESTS = {
+    "kolmogorov": (kolmogorov_test, ("variable",)),
+    "cramersv": (cramersv, ("target_feature", "input_feature")),
+    "kruskal": (kruskal_test, ("target_variable", "input_variable")),
+}
+
+
+def run_eda(dataset, tests: Dict[str, list], n_jobs: int = -1):
+    """
+    This function runs several statistical tests over many columns in
+    parallel, which is much faster than calling the tests one by one when
+    the dataframe is wide.
+
+    Arguments:
+        dataset: pandas dataframe or dict with de format {'col1':np.array, 'col2':np.array}
+        tests: dict mapping the name of a test to the columns to evaluate:
+            - kolmogorov: list of numerical variables
+            - cramersv: list of (target_feature, input_feature) tuples
+            - kruskal: list of (target_variable, input_variable) tuples
+        n_jobs: number of workers used by joblib (-1 uses all the cores)
+
+    Returns a dict mapping (test, *columns) to the (statistic, p_value) tuple
+    """
+
+    for test in tests:
+        assert test in _EDA_TESTS, f"test must be one of {list(_EDA_TESTS)}"
+
+    dataset = _ensure_df(dataset)
+
+    keys = []
+    jobs = []
+    for test, columns in tests.items():
+        func, params = _EDA_TESTS[test]
+        for column in columns:
+            args = (column,) if isinstance(column, str) else tuple(column)
+            keys.append((test, *args))
+            # bind by keyword so the documented tuple order cannot drift
+            # from the positional order of the test's signature
+            jobs.append(delayed(func)(dataset, verbose=False, **dict(zip(params, args))))
+
+    results = Parallel(n_jobs=n_jobs, backend="loky", batch_size="auto")(jobs)
+
+    # printing happens here, in the main process, to keep stdout readable
+    for key, result in zip(keys, results):
+        print(
+            f"{key[0]} {' ~ '.join(key[1:])}: "
+            f"statistic={result.statistic:.3f}, p_value={result.p_value:.3f}"
+        )
+
+    return dict(zip(keys, results))